@@ -4,6 +4,8 @@ from aenum import Enum
 
 
 class PhoneNumberFormat(Enum):
+    _init_ = "value string"
+
     E164 = 0, "E164"
     INTERNATIONAL = 1, "INTERNATIONAL"
     NATIONAL = 2, "NATIONAL"
@@ -19,12 +21,13 @@ class PhoneNumberFormat(Enum):
 
     @classmethod
     def _missing_value_(cls, value):
-        # noinspection PyTypeChecker
-        for member in cls:
-            if isinstance(value, str) and member.value == value.upper():
-                return member
-            if member.string == value:
-                return member
+        if isinstance(value, str):
+            return cls._LOOKUP.get(value.upper())
+        return None
+
+
+# Case-insensitive lookup by name, built once rather than scanning the members on every miss.
+PhoneNumberFormat._LOOKUP = {member.string.upper(): member for member in PhoneNumberFormat}
 
 
 # this works around a pycharm issue PY-30216
@@ -50,6 +53,7 @@ NAMED_NUMBER_FORMATS = [
     "sms_services",
     "no_international_dialling",
 ]
+NAMED_NUMBER_FORMATS_SET = frozenset(NAMED_NUMBER_FORMATS)
 
 
 # PhoneRegion = namedtuple("PhoneRegion", ["country_code", "region_code"])
@@ -36,7 +36,13 @@ Local numbers without prefixes are the simplest format of phone number.
         None indicates we will accept the default of True
 """
 
-from typing import Iterable, List, Optional, Union
+from __future__ import annotations
+
+import functools
+import itertools
+import operator
+import sys
+from typing import Any, Iterable, NamedTuple
 
 from hypothesis import strategies as st
 from hypothesis.errors import InvalidArgument
@@ -50,186 +56,473 @@ from hypothesis.strategies._internal.strategies import Ex
 from hypothesis.strategies._internal.utils import defines_strategy
 from phonenumbers import (
     COUNTRY_CODE_TO_REGION_CODE,
-    SUPPORTED_REGIONS,
     PhoneMetadata,
     PhoneNumber,
     format_number,
     parse,
 )
 
-from hypothesis_phonenumbers.data import NAMED_NUMBER_FORMATS, PhoneNumberFormat, PhoneNumberRegion, RegionalNamedFormat
+try:
+    # noinspection PyProtectedMember
+    from re import _parser as sre_parse  # Python 3.11+ deprecates the top level sre_parse module.
+except ImportError:  # pragma: no cover
+    import sre_parse  # type: ignore[no-redef]
+
+from hypothesis_phonenumbers.data import (
+    NAMED_NUMBER_FORMATS,
+    NAMED_NUMBER_FORMATS_SET,
+    PhoneNumberFormat,
+    PhoneNumberRegion,
+    RegionalNamedFormat,
+)
 
-NUMBER_FORMATS: List[RegionalNamedFormat] = []
-METADATA_DICT = {}
-PHONE_NUMBER_REGIONS: List[PhoneNumberRegion[int, str]] = []
-for _k, _v in COUNTRY_CODE_TO_REGION_CODE.items():
-    for _i in _v:
-        PHONE_NUMBER_REGIONS.append(PhoneNumberRegion(_k, _i))
+PHONE_NUMBER_DIGITS = "0123456789"
+phone_number_characters = st.sampled_from(PHONE_NUMBER_DIGITS)
 
 
-for __phone_region in PHONE_NUMBER_REGIONS:
-    __metadata: PhoneMetadata = PhoneMetadata.metadata_for_region_or_calling_code(
-        __phone_region.country_code, __phone_region.region_code
-    )
-    __data = {"id": __metadata.id, "country_code": __metadata.country_code, "regexes": {}}
+class RegexNode(NamedTuple):
+    """A single step of a compiled phone number pattern.
+
+    kind is the sre opcode the node was built from, IN for a run of characters from one character set,
+    MAX_REPEAT or BRANCH. children holds the nodes being repeated, or the tuple of alternatives for a branch.
+    characters and counts are the character set and the repeat bounds. Nodes are plain data,
+    PhoneRegexStrategy attaches the strategies that draw them.
+    """
+
+    kind: Any
+    children: tuple
+    characters: str = ""
+    counts: tuple[int, int] = (1, 1)
+
+
+@functools.lru_cache(maxsize=None)
+def _character_run_strategy(characters: str, min_count: int, max_count: int) -> SearchStrategy[str]:
+    if min_count == max_count == 1:
+        return st.sampled_from(characters)
+    # A whole run is a single draw, rather than one draw per character.
+    return st.text(alphabet=characters, min_size=min_count, max_size=max_count)
+
+
+@functools.lru_cache(maxsize=None)
+def _repeat_count_strategy(min_count: int, max_count: int) -> SearchStrategy[int]:
+    return st.integers(min_count, max_count)
+
+
+def _character_set(items: Iterable[tuple[Any, Any]]) -> set[str]:
+    characters = set()
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            characters.add(chr(av))
+        elif op is sre_parse.RANGE:
+            characters.update(chr(c) for c in range(av[0], av[1] + 1))
+        elif op is sre_parse.CATEGORY and av is sre_parse.CATEGORY_DIGIT:
+            characters.update(PHONE_NUMBER_DIGITS)
+        else:
+            raise ValueError(f"Unsupported character set operation: {op}")  # NOQA: TRY003
+    return characters
+
+
+def _compile_subpattern(subpattern: Iterable[tuple[Any, Any]]) -> tuple[RegexNode, ...]:
+    nodes = []
+    for op, av in subpattern:
+        if op is sre_parse.LITERAL:
+            characters = {chr(av)}
+        elif op is sre_parse.IN:
+            characters = _character_set(av)
+        elif op is sre_parse.MAX_REPEAT or op is sre_parse.MIN_REPEAT:
+            min_count, max_count, repeated = av
+            if max_count is sre_parse.MAXREPEAT:
+                raise ValueError("Unbounded repeats are not supported")  # NOQA: TRY003
+            children = _compile_subpattern(repeated)
+            if len(children) == 1 and children[0].kind is sre_parse.IN and children[0].counts == (1, 1):
+                # Repeating a single character set, such as \d{6}, is itself a run of characters.
+                nodes.append(
+                    RegexNode(sre_parse.IN, (), characters=children[0].characters, counts=(min_count, max_count))
+                )
+            else:
+                nodes.append(RegexNode(sre_parse.MAX_REPEAT, children, counts=(min_count, max_count)))
+            continue
+        elif op is sre_parse.BRANCH:
+            alternatives = tuple(_compile_subpattern(branch) for branch in av[1])
+            nodes.append(RegexNode(sre_parse.BRANCH, alternatives))
+            continue
+        elif op is sre_parse.SUBPATTERN:
+            nodes.extend(_compile_subpattern(av[-1]))
+            continue
+        else:
+            raise ValueError(f"Unsupported regex operation: {op}")  # NOQA: TRY003
+        # Same restriction from_regex applies through its alphabet argument.
+        characters &= set(PHONE_NUMBER_DIGITS)
+        if not characters:
+            raise ValueError("Character set has no phone number characters")  # NOQA: TRY003
+        __characters = "".join(sorted(characters))
+        nodes.append(RegexNode(sre_parse.IN, (), characters=__characters))
+    return tuple(nodes)
+
+
+def _compile_phone_regex(pattern: str) -> tuple[RegexNode, ...] | None:
+    """Compile the regex subset used by phone number metadata into nodes that can be sampled directly.
+
+    Returns None for patterns using anything outside that subset, these fall back to st.from_regex.
+    """
+    try:
+        return _compile_subpattern(sre_parse.parse(pattern))
+    except ValueError:
+        return None
+
+
+def _draw_steps(nodes: tuple[RegexNode, ...]) -> tuple[tuple[Any, SearchStrategy, tuple], ...]:
+    """Pair each node's kind with the strategy drawing it, a run of characters, a repeat count or an alternative."""
+    steps = []
+    for node in nodes:
+        if node.kind is sre_parse.IN:
+            steps.append((node.kind, _character_run_strategy(node.characters, *node.counts), ()))
+        elif node.kind is sre_parse.MAX_REPEAT:
+            steps.append((node.kind, _repeat_count_strategy(*node.counts), _draw_steps(node.children)))
+        else:
+            alternatives = tuple(_draw_steps(branch) for branch in node.children)
+            steps.append((node.kind, st.sampled_from(alternatives), alternatives))
+    return tuple(steps)
+
+
+def _draw_from_steps(
+    data: ConjectureData, steps: tuple[tuple[Any, SearchStrategy, tuple], ...], parts: list[str]
+) -> None:
+    for kind, strategy, children in steps:
+        if kind is sre_parse.IN:
+            parts.append(data.draw(strategy))
+        elif kind is sre_parse.MAX_REPEAT:
+            for _ in range(data.draw(strategy)):
+                _draw_from_steps(data, children, parts)
+        else:
+            _draw_from_steps(data, data.draw(strategy), parts)
+
+
+def _character_runs(nodes: tuple[RegexNode, ...]) -> list[tuple[str, int, int]] | None:
+    """Reduce branch free nodes to runs of (characters, min_count, max_count), merging adjacent runs of one set.
+
+    Returns None when the nodes contain a branch, or a variable repeat of anything but a single character set.
+    """
+    runs: list[tuple[str, int, int]] = []
+    for node in nodes:
+        if node.kind is sre_parse.IN:
+            node_runs = [(node.characters, *node.counts)]
+        elif node.kind is sre_parse.MAX_REPEAT and node.counts[0] == node.counts[1]:
+            repeated_runs = _character_runs(node.children)
+            if repeated_runs is None:
+                return None
+            node_runs = repeated_runs * node.counts[0]
+        else:
+            return None
+        for characters, min_count, max_count in node_runs:
+            if runs and runs[-1][0] == characters:
+                runs[-1] = (characters, runs[-1][1] + min_count, runs[-1][2] + max_count)
+            else:
+                runs.append((characters, min_count, max_count))
+    return runs
+
+
+def _run_parts(runs: list[tuple[str, int, int]]) -> tuple[str | SearchStrategy[str], ...]:
+    """Turn character runs into literal strings, for runs that can only produce one string, and run strategies."""
+    parts: list[str | SearchStrategy[str]] = []
+    for characters, min_count, max_count in runs:
+        if len(characters) == 1 and min_count == max_count:
+            if parts and isinstance(parts[-1], str):
+                parts[-1] += characters * min_count
+            else:
+                parts.append(characters * min_count)
+        else:
+            parts.append(_character_run_strategy(characters, min_count, max_count))
+    return tuple(parts)
+
+
+class PhoneRegexStrategy(SearchStrategy):
+    """Generates strings fully matching a compiled phone number pattern, without backtracking or rejection.
 
-    # National Call Prefixes for easier lookup by the strategy.
-    if hasattr(__metadata, "national_prefix") and __metadata.national_prefix is not None:
-        __data["national_prefix"] = __metadata.national_prefix
+    Branch free patterns, such as 900[2-9]\\d{6}, are flattened into literal text and character runs
+    so drawing them is a short loop instead of a walk over the nodes.
+    """
 
-    # Known number formats for easier lookup by the strategy.
-    for number_format in NAMED_NUMBER_FORMATS:
-        if hasattr(__metadata, number_format) and getattr(__metadata, number_format) is not None:
-            __data["regexes"][number_format] = getattr(__metadata, number_format).national_number_pattern
-            NUMBER_FORMATS.append(
+    def __init__(self, nodes: tuple[RegexNode, ...]) -> None:
+        super().__init__()
+        self.nodes = nodes
+        runs = _character_runs(nodes)
+        self.run_parts = None if runs is None else _run_parts(runs)
+        self.steps = _draw_steps(nodes) if runs is None else ()
+
+    def do_draw(self, data: ConjectureData) -> str:
+        if self.run_parts is not None:
+            return "".join([part if isinstance(part, str) else data.draw(part) for part in self.run_parts])
+        parts: list[str] = []
+        _draw_from_steps(data, self.steps, parts)
+        return "".join(parts)
+
+
+def _pattern_strategy(pattern: str) -> SearchStrategy[str]:
+    """Strategy for strings fully matching a phone number pattern, sampled directly when the pattern compiles."""
+    nodes = _compile_phone_regex(pattern)
+    if nodes is not None:
+        return PhoneRegexStrategy(nodes)
+    return st.from_regex(regex=pattern, alphabet=phone_number_characters, fullmatch=True)
+
+
+# Pattern strategies are built on first use, compiling all of them would dominate the import time.
+_PATTERN_STRATEGY_CACHE: dict[str, SearchStrategy[str]] = {}
+
+
+def _cached_pattern_strategy(pattern: str) -> SearchStrategy[str]:
+    strategy = _PATTERN_STRATEGY_CACHE.get(pattern)
+    if strategy is None:
+        strategy = _PATTERN_STRATEGY_CACHE[pattern] = _pattern_strategy(pattern)
+    return strategy
+
+
+# Fetches every named number format's description from a PhoneMetadata in a single call.
+_named_number_format_getter = operator.attrgetter(*NAMED_NUMBER_FORMATS)
+
+
+def _build_metadata() -> tuple[list[PhoneNumberRegion], dict[PhoneNumberRegion, dict], tuple[RegionalNamedFormat, ...]]:
+    """Collect the region list, per region metadata and named number formats from the phonenumbers package."""
+    phone_number_regions = [
+        PhoneNumberRegion(country_code, region_code)
+        for country_code, region_codes in COUNTRY_CODE_TO_REGION_CODE.items()
+        for region_code in region_codes
+    ]
+    metadata_dict = {}
+    number_formats = []
+    for phone_region in phone_number_regions:
+        metadata: PhoneMetadata = PhoneMetadata.metadata_for_region_or_calling_code(
+            phone_region.country_code, phone_region.region_code
+        )
+        data = {"id": metadata.id, "country_code": metadata.country_code, "regexes": {}}
+
+        # National Call Prefixes for easier lookup by the strategy.
+        if hasattr(metadata, "national_prefix") and metadata.national_prefix is not None:
+            data["national_prefix"] = metadata.national_prefix
+
+        # Known number formats for easier lookup by the strategy.
+        for number_format, number_desc in zip(NAMED_NUMBER_FORMATS, _named_number_format_getter(metadata)):
+            if number_desc is None:
+                continue
+            pattern = number_desc.national_number_pattern
+            data["regexes"][number_format] = pattern
+            number_formats.append(
                 RegionalNamedFormat(
-                    region=__phone_region,
+                    region=phone_region,
                     format_name=number_format,
-                    format_regex=getattr(__metadata, number_format).national_number_pattern,
+                    format_regex=pattern,
                 )
             )
-    METADATA_DICT[__phone_region] = __data
+        data["format_set"] = frozenset(data["regexes"])
+        metadata_dict[phone_region] = data
+    # Only ever read after this, so freeze it.
+    return phone_number_regions, metadata_dict, tuple(number_formats)
+
+
+PHONE_NUMBER_REGIONS: list[PhoneNumberRegion[int, str]]
+METADATA_DICT: dict[PhoneNumberRegion, dict]
+NUMBER_FORMATS: tuple[RegionalNamedFormat, ...]
+PHONE_NUMBER_REGIONS, METADATA_DICT, NUMBER_FORMATS = _build_metadata()
+PHONE_NUMBER_REGIONS_SET = frozenset(PHONE_NUMBER_REGIONS)
+# Region indexes for region_finder. Region codes map to tuples too, as the non geographic "001" has many country codes.
+__regions_by_country_code: dict[int, list[PhoneNumberRegion]] = {}
+__regions_by_region_code: dict[str, list[PhoneNumberRegion]] = {}
+for __phone_region in PHONE_NUMBER_REGIONS:
+    __regions_by_country_code.setdefault(__phone_region.country_code, []).append(__phone_region)
+    __regions_by_region_code.setdefault(__phone_region.region_code, []).append(__phone_region)
+REGIONS_BY_COUNTRY_CODE: dict[int, tuple[PhoneNumberRegion, ...]] = {
+    code: tuple(regions) for code, regions in __regions_by_country_code.items()
+}
+REGIONS_BY_REGION_CODE: dict[str, tuple[PhoneNumberRegion, ...]] = {
+    code: tuple(regions) for code, regions in __regions_by_region_code.items()
+}
+__number_formats_by_region: dict[PhoneNumberRegion, list[RegionalNamedFormat]] = {
+    region: [] for region in PHONE_NUMBER_REGIONS
+}
+for __number_format in NUMBER_FORMATS:
+    __number_formats_by_region[__number_format.region].append(__number_format)
+NUMBER_FORMATS_BY_REGION: dict[PhoneNumberRegion, tuple[RegionalNamedFormat, ...]] = {
+    region: tuple(number_formats) for region, number_formats in __number_formats_by_region.items()
+}
+# Flat per-region views of the fields the strategies read while drawing, so the hot path avoids METADATA_DICT.
+REGEX_BY_REGION: dict[PhoneNumberRegion, dict[str, str]] = {}
+FORMAT_SET_BY_REGION: dict[PhoneNumberRegion, frozenset[str]] = {}
+HAS_TRUNK: frozenset[PhoneNumberRegion] = frozenset(
+    region for region, data in METADATA_DICT.items() if "national_prefix" in data
+)
 
-phone_number_characters = st.sampled_from(elements=("0", "1", "2", "3", "4", "5", "6", "7", "8", "9"))
+for __phone_region, __data in METADATA_DICT.items():
+    FORMAT_SET_BY_REGION[__phone_region] = __data["format_set"]
+    for number_format, __pattern in __data["regexes"].items():
+        # Many regions share patterns, so intern them to keep a single copy of each.
+        __data["regexes"][number_format] = sys.intern(__pattern)
+    REGEX_BY_REGION[__phone_region] = __data["regexes"]
 
 
 def region_filter(
-    regions_to_filter: Optional[Iterable[PhoneNumberRegion]] = None,
-    has_national_trunk_prefix: Optional[bool] = None,
-    required_number_formats: Optional[Iterable[str]] = None,
-) -> List[PhoneNumberRegion[int, str]]:
-    if required_number_formats is not None and not set(required_number_formats).issubset(set(NAMED_NUMBER_FORMATS)):
+    regions_to_filter: Iterable[PhoneNumberRegion] | None = None,
+    has_national_trunk_prefix: bool | None = None,
+    required_number_formats: Iterable[str] | None = None,
+) -> list[PhoneNumberRegion[int, str]]:
+    if required_number_formats is not None and not NAMED_NUMBER_FORMATS_SET.issuperset(required_number_formats):
         raise ValueError("Invalid required named number format")  # NOQA: TRY003
     if regions_to_filter is None:
         regions_to_filter = PHONE_NUMBER_REGIONS
+    __required_formats = frozenset(required_number_formats) if required_number_formats else None
     for region in regions_to_filter:
-        checks = []
-        if has_national_trunk_prefix:
-            checks.append("national_prefix" in METADATA_DICT[region])
-        if required_number_formats:
-            for __number_format in required_number_formats:
-                checks.append(__number_format in METADATA_DICT[region]["regexes"])
-        if all(checks):
-            yield region
+        if has_national_trunk_prefix and region not in HAS_TRUNK:
+            continue
+        if __required_formats is not None and not FORMAT_SET_BY_REGION[region] >= __required_formats:
+            continue
+        yield region
 
 
 def region_finder(
-    country_codes: Optional[List[int]] = None,
-    region_codes: Optional[List[str]] = None,
-) -> List[PhoneNumberRegion[int, str]]:
+    country_codes: list[int] | None = None,
+    region_codes: list[str] | None = None,
+) -> list[PhoneNumberRegion[int, str]]:
     if country_codes is not None and region_codes is not None:
         raise InvalidArgument("Cannot specify both country code and region code")  # NOQA: TRY003
+    # Deduplicated with dict.fromkeys rather than a set, so the result order follows the input and is stable.
     if country_codes is not None:
-        for country_code in country_codes:
-            if country_code.upper() not in SUPPORTED_REGIONS:
-                raise InvalidArgument(f"Invalid country code: {country_code}")  # NOQA: TRY003
-    if region_codes is not None:
-        for region_code in region_codes:
-            if region_code in COUNTRY_CODE_TO_REGION_CODE:
-                raise InvalidArgument(f"Invalid region code: {region_code}")  # NOQA: TRY003
-    if country_codes is not None:
-        return [__region for __region in PHONE_NUMBER_REGIONS if __region.country_code in country_codes]
+        __country_codes = dict.fromkeys(country_codes)
+        __invalid_country_codes = __country_codes.keys() - REGIONS_BY_COUNTRY_CODE.keys()
+        if __invalid_country_codes:
+            raise InvalidArgument(f"Invalid country codes: {sorted(__invalid_country_codes, key=repr)}")  # NOQA: TRY003
+        return list(itertools.chain.from_iterable(REGIONS_BY_COUNTRY_CODE[code] for code in __country_codes))
     elif region_codes is not None:
-        return [__region for __region in PHONE_NUMBER_REGIONS if __region.region_code in region_codes]
+        __non_string_region_codes = [region_code for region_code in region_codes if not isinstance(region_code, str)]
+        if __non_string_region_codes:
+            raise InvalidArgument(f"Region codes must be strings: {__non_string_region_codes}")  # NOQA: TRY003
+        __region_codes = dict.fromkeys(region_code.upper() for region_code in region_codes)
+        __invalid_region_codes = __region_codes.keys() - REGIONS_BY_REGION_CODE.keys()
+        if __invalid_region_codes:
+            raise InvalidArgument(f"Invalid region codes: {sorted(__invalid_region_codes)}")  # NOQA: TRY003
+        return list(itertools.chain.from_iterable(REGIONS_BY_REGION_CODE[code] for code in __region_codes))
 
 
 def named_number_formats_from_regions(regions: Iterable[PhoneNumberRegion[int, str]]) -> Iterable[str]:
     __number_formats = set()
     for region in regions:
-        for __key in METADATA_DICT[region]["regexes"]:
-            __number_formats.update(__key)
-    return __number_formats
+        __number_formats |= FORMAT_SET_BY_REGION[region]
+    return frozenset(__number_formats)
 
 
 class BasePhoneNumberStrategy(SearchStrategy):
     regions = PHONE_NUMBER_REGIONS
     named_number_formats = NAMED_NUMBER_FORMATS
-    selected_region: Optional[PhoneNumberRegion] = None
-    selected_named_number_format = Optional[str] = None
 
     def __init__(
         self,
-        regions: Optional[Union[List[PhoneNumberRegion], List[tuple]]] = None,
-        named_number_formats: Optional[List[str]] = None,
+        regions: list[PhoneNumberRegion] | list[tuple] | None = None,
+        named_number_formats: list[str] | None = None,
     ) -> None:
         super().__init__()
         if regions is not None:
             self.regions = [PhoneNumberRegion(*region) for region in regions]  # Normalize the types.
             for region in self.regions:
-                if region not in PHONE_NUMBER_REGIONS:
+                if region not in PHONE_NUMBER_REGIONS_SET:
                     # This might be a little confusing for tuple inputs
                     raise InvalidArgument(f"Invalid region: {region}")  # NOQA: TRY003
 
         if named_number_formats is not None:
             for __name in named_number_formats:
-                if __name not in NAMED_NUMBER_FORMATS:
+                if __name not in NAMED_NUMBER_FORMATS_SET:
                     raise InvalidArgument(f"Invalid number format: {__name} in named_number_formats")  # NOQA: TRY003
             self.named_number_formats = named_number_formats
-
-        self.available_formats = []
-        for _format in NUMBER_FORMATS:
-            if _format.region in self.regions and _format.format_name in self.named_number_formats:
-                self.available_formats.append(_format)
-
-    def do_draw(self, data: ConjectureData) -> Ex:
+        self._format_set = frozenset(self.named_number_formats)
+
+        self.available_formats = [
+            _format
+            for region in dict.fromkeys(self.regions)
+            for _format in NUMBER_FORMATS_BY_REGION[region]
+            if _format.format_name in self._format_set
+        ]
+
+        # Prebuilt draw strategies, regions without any of the requested formats can never produce a number.
+        self._sampled_formats_by_region = {}
+        for region in self.regions:
+            __region_formats = FORMAT_SET_BY_REGION[region] & self._format_set
+            if __region_formats:
+                self._sampled_formats_by_region[region] = st.sampled_from(sorted(__region_formats))
+        self._regions_strategy = st.sampled_from([
+            region for region in self.regions if region in self._sampled_formats_by_region
+        ])
+
+    def _draw_region_and_number(self, data: ConjectureData) -> tuple[PhoneNumberRegion, str]:
         """
         # 1 - Select Region
         # 2 - Select a Number format to generate
         # 3 - Attach suitable prefixes at random when desired.
+
+        Draw state is kept local so the strategy itself stays immutable once constructed.
         """
-        self.selected_region: PhoneNumberRegion = data.draw(st.sampled_from(self.regions))
-        available_formats = set(METADATA_DICT[self.selected_region]["regexes"].keys()).intersection(
-            set(self.named_number_formats)
-        )
-        self.selected_named_number_format = data.draw(st.sampled_from(available_formats))
+        selected_region: PhoneNumberRegion = data.draw(self._regions_strategy)
         # intersection of available formats and our selected formats
+        selected_named_number_format = data.draw(self._sampled_formats_by_region[selected_region])
         selected_phone_number = data.draw(
-            st.from_regex(
-                regex=METADATA_DICT[self.selected_region]["regexes"][self.selected_named_number_format],
-                alphabet=phone_number_characters,
-                fullmatch=True,
-            )
+            _cached_pattern_strategy(REGEX_BY_REGION[selected_region][selected_named_number_format])
         )
-        return selected_phone_number
+        return selected_region, selected_phone_number
+
+    def do_draw(self, data: ConjectureData) -> Ex:
+        return self._draw_region_and_number(data)[1]
+
+
+@functools.lru_cache(maxsize=256)
+def _phone_number_strategy(
+    regions: tuple[tuple, ...] | None, number_formats: tuple[str, ...] | None
+) -> BasePhoneNumberStrategy:
+    # Strategies keep no per-draw state, so one instance can be shared by every call with the same arguments.
+    return BasePhoneNumberStrategy(
+        regions=None if regions is None else list(regions),
+        named_number_formats=None if number_formats is None else list(number_formats),
+    )
 
 
 @defines_strategy(force_reusable_values=True)
 def phone_number(
-    *, regions: Optional[Union[List[PhoneNumberRegion], List[tuple]]] = None, number_formats: Optional[List[str]] = None
+    *, regions: list[PhoneNumberRegion] | list[tuple] | None = None, number_formats: list[str] | None = None
 ) -> st.SearchStrategy[str]:
-    return BasePhoneNumberStrategy(
-        regions=regions,
-        named_number_formats=number_formats,
-    )
+    try:
+        __key = (
+            None if regions is None else tuple(tuple(region) for region in regions),
+            None if number_formats is None else tuple(number_formats),
+        )
+        hash(__key)
+    except TypeError as error:
+        raise InvalidArgument(f"Invalid regions {regions!r} or number formats {number_formats!r}") from error  # NOQA: TRY003
+    return _phone_number_strategy(*__key)
 
 
 class ParsedPhoneNumberStrategy(BasePhoneNumberStrategy):
-    parsed_phone_number: Optional[PhoneNumber] = None
+    def _draw_parsed_phone_number(self, data: ConjectureData) -> PhoneNumber:
+        selected_region, selected_phone_number = self._draw_region_and_number(data)
+        return parse(selected_phone_number, selected_region.region_code)
 
     def do_draw(self, data: ConjectureData) -> Ex:
-        selected_phone_number = super().do_draw(data=data)
-        self.parsed_phone_number: PhoneNumber = parse(selected_phone_number, self.selected_region.region_code)
-        return self.parsed_phone_number
+        return self._draw_parsed_phone_number(data)
 
 
 class FormattedPhoneNumberStrategy(ParsedPhoneNumberStrategy):
     def __init__(
         self,
         *,
-        regions: Optional[Union[List[PhoneNumberRegion, List[tuple]]]] = None,
-        number_formats: Optional[List[str]] = None,
-        display_formats: Optional[List[PhoneNumberFormat]] = None,
+        regions: list[PhoneNumberRegion] | list[tuple] | None = None,
+        number_formats: list[str] | None = None,
+        display_formats: list[PhoneNumberFormat] | None = None,
     ) -> None:
         super().__init__(regions=regions, named_number_formats=number_formats)
         if display_formats is not None:
             self.display_formats = display_formats
         else:
             self.display_formats = PhoneNumberFormat
+        self._display_formats_strategy = st.sampled_from(self.display_formats)
 
     def do_draw(self, data: ConjectureData) -> Ex:
-        super().do_draw(data=data)
-        selected_format = data.draw(st.sampled_from(self.display_formats))
-        formatted_number = format_number(self.parsed_phone_number, selected_format)
+        parsed_phone_number = self._draw_parsed_phone_number(data)
+        selected_format = data.draw(self._display_formats_strategy)
+        formatted_number = format_number(parsed_phone_number, PhoneNumberFormat(selected_format).value)
         return formatted_number
 
 
@@ -0,0 +1,14 @@
+import pytest
+
+from hypothesis_phonenumbers.data import PhoneNumberFormat
+
+
+def test_phone_number_format_lookup_by_name():
+    assert PhoneNumberFormat("e164") is PhoneNumberFormat.E164
+    assert PhoneNumberFormat("National") is PhoneNumberFormat.NATIONAL
+    assert PhoneNumberFormat(3) is PhoneNumberFormat.RFC3966
+    assert str(PhoneNumberFormat.INTERNATIONAL) == "INTERNATIONAL"
+    with pytest.raises(ValueError):
+        PhoneNumberFormat("not_a_format")
+    with pytest.raises(ValueError):
+        PhoneNumberFormat([1])
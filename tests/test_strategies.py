@@ -0,0 +1,173 @@
+import re
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from hypothesis.errors import InvalidArgument
+from phonenumbers import PhoneNumber
+
+from hypothesis_phonenumbers.data import PhoneNumberRegion
+from hypothesis_phonenumbers.strategies import (
+    _PATTERN_STRATEGY_CACHE,
+    METADATA_DICT,
+    REGEX_BY_REGION,
+    BasePhoneNumberStrategy,
+    FormattedPhoneNumberStrategy,
+    ParsedPhoneNumberStrategy,
+    PhoneRegexStrategy,
+    _cached_pattern_strategy,
+    _character_run_strategy,
+    _compile_phone_regex,
+    _pattern_strategy,
+    named_number_formats_from_regions,
+    phone_number,
+    region_filter,
+    region_finder,
+)
+
+AU = PhoneNumberRegion(61, "AU")
+NZ = PhoneNumberRegion(64, "NZ")
+
+
+def test_strategy_rejects_invalid_arguments():
+    with pytest.raises(InvalidArgument):
+        BasePhoneNumberStrategy(named_number_formats=["not_a_format"])
+    with pytest.raises(InvalidArgument):
+        BasePhoneNumberStrategy(regions=[(61, "NZ")])
+
+
+@given(phone_number(regions=[AU], number_formats=["mobile"]))
+def test_phone_number_matches_region_pattern(number):
+    assert re.fullmatch(METADATA_DICT[AU]["regexes"]["mobile"], number)
+
+
+@given(phone_number())
+def test_phone_number_is_digits(number):
+    assert number.isdigit()
+
+
+def test_regions_without_requested_formats_are_not_sampled():
+    strategy = BasePhoneNumberStrategy(named_number_formats=["pager"])
+    assert 0 < len(strategy._sampled_formats_by_region) < len(strategy.regions)
+    for region in strategy._sampled_formats_by_region:
+        assert "pager" in METADATA_DICT[region]["regexes"]
+
+
+@pytest.mark.parametrize(
+    "pattern", sorted({pattern for data in METADATA_DICT.values() for pattern in data["regexes"].values()})
+)
+@settings(max_examples=10)
+@given(data=st.data())
+def test_every_pattern_strategy_fullmatches(pattern, data):
+    assert re.fullmatch(pattern, data.draw(_cached_pattern_strategy(pattern)))
+
+
+def test_pattern_strategies_are_built_once_on_first_use():
+    pattern = r"12[3-5]\d{2}"
+    assert pattern not in _PATTERN_STRATEGY_CACHE
+    strategy = _cached_pattern_strategy(pattern)
+    assert _PATTERN_STRATEGY_CACHE[pattern] is strategy
+    assert _cached_pattern_strategy(pattern) is strategy
+
+
+@pytest.mark.parametrize("pattern", [r"\d*", r"[^5]\d{2}", r"(?=1)\d{3}"])
+def test_unsupported_patterns_are_not_compiled(pattern):
+    assert _compile_phone_regex(pattern) is None
+
+
+@given(data=st.data())
+def test_unsupported_patterns_fall_back_to_from_regex(data):
+    pattern = r"[^0-8]\d*"
+    strategy = _pattern_strategy(pattern)
+    assert not isinstance(strategy, PhoneRegexStrategy)
+    assert re.fullmatch(pattern, data.draw(strategy))
+
+
+def test_named_number_formats_from_regions():
+    assert "mobile" in named_number_formats_from_regions([AU])
+    assert "m" not in named_number_formats_from_regions([AU])
+
+
+def test_region_filter():
+    assert AU in region_filter(has_national_trunk_prefix=True, required_number_formats=["mobile"])
+    with pytest.raises(ValueError):
+        list(region_filter(required_number_formats=["not_a_format"]))
+
+
+@given(ParsedPhoneNumberStrategy(regions=[AU]))
+def test_parsed_phone_number(number):
+    assert isinstance(number, PhoneNumber)
+    assert number.country_code == 61
+
+
+@given(FormattedPhoneNumberStrategy(regions=[AU]))
+def test_formatted_phone_number(number):
+    assert isinstance(number, str)
+
+
+def test_regex_by_region_covers_every_region_format():
+    assert {region: data["regexes"] for region, data in METADATA_DICT.items()} == REGEX_BY_REGION
+
+
+def run_parts(pattern):
+    return PhoneRegexStrategy(_compile_phone_regex(pattern)).run_parts
+
+
+def test_run_parts_fold_literals_and_merge_runs():
+    digits = "0123456789"
+    assert run_parts(r"900[2-9]\d{6}") == (
+        "900",
+        _character_run_strategy("23456789", 1, 1),
+        _character_run_strategy(digits, 6, 6),
+    )
+    assert run_parts(r"(?:\d{1,2}){2}") == (_character_run_strategy(digits, 2, 4),)
+    assert run_parts(r"1\d\d3") == ("1", _character_run_strategy(digits, 2, 2), "3")
+    assert run_parts(r"12(?:34)") == ("1234",)
+    assert run_parts(r"4\d|5") is None
+    assert run_parts(r"(?:\d[2-9]){1,2}") is None
+
+
+def test_region_finder():
+    assert AU in region_finder(country_codes=[61])
+    assert region_finder(region_codes=["au"]) == [AU]
+    with pytest.raises(InvalidArgument):
+        region_finder(country_codes=[9999])
+    with pytest.raises(InvalidArgument):
+        region_finder(region_codes=["XX"])
+    with pytest.raises(InvalidArgument):
+        region_finder(country_codes=["61", 9999])
+    with pytest.raises(InvalidArgument):
+        region_finder(region_codes=[61])
+    with pytest.raises(InvalidArgument):
+        region_finder(region_codes=[["AU"]])
+
+
+def test_region_finder_follows_input_order_without_duplicates():
+    assert region_finder(region_codes=["NZ", "AU", "nz"]) == [NZ, AU]
+    assert region_finder(country_codes=[64, 61, 64]) == [NZ, *region_finder(country_codes=[61])]
+
+
+def test_region_finder_accepts_non_geographic_region_code():
+    non_geographic = region_finder(region_codes=["001"])
+    assert len(non_geographic) > 1
+    assert {region.region_code for region in non_geographic} == {"001"}
+
+
+def test_phone_number_reuses_strategy_for_same_arguments():
+    first = phone_number(regions=[(61, "AU")], number_formats=["mobile"]).wrapped_strategy
+    second = phone_number(regions=[AU], number_formats=["mobile"]).wrapped_strategy
+    assert first is second
+
+
+@pytest.mark.parametrize("kwargs", [{"number_formats": [["mobile"]]}, {"regions": [([61], "AU")]}, {"regions": [61]}])
+def test_phone_number_rejects_unhashable_arguments(kwargs):
+    with pytest.raises(InvalidArgument):
+        phone_number(**kwargs).validate()
+
+
+def test_available_formats_only_cover_requested_regions_and_formats():
+    strategy = BasePhoneNumberStrategy(regions=[AU, AU], named_number_formats=["mobile", "voip"])
+    assert [(_format.region, _format.format_name) for _format in strategy.available_formats] == [
+        (AU, "mobile"),
+        (AU, "voip"),
+    ]